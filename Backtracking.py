@@ -66,11 +66,11 @@ class KakuroBoardSolver:
                     
 
     def backtrack(self, kakuro_board):
-        """ Backtracking algorithm to solve a Kakuro puzzle: returns timeline of all board states leading to solution """
-        self.timeline.append(kakuro_board.deep_copy())
+        """ Backtracking algorithm to solve a Kakuro puzzle: records snapshots of all board states leading to solution in the timeline """
+        self.timeline.append(kakuro_board.snapshot())
         # Apply AC-3 to reduce domains before starting
         self.ac3(kakuro_board)
-        self.timeline.append(kakuro_board.deep_copy())
+        self.timeline.append(kakuro_board.snapshot())
 
         # Check if the board is complete
         if kakuro_board.is_complete():
@@ -0,0 +1,157 @@
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for batch propagation
+    np = None
+
+from Backtracking import KakuroBoardSolver
+
+DIGITS = None if np is None else np.arange(1, 10)
+BITS = None if np is None else (1 << DIGITS).astype(np.uint16)
+
+
+class KakuroBatchPropagator:
+    """ Stacks many Kakuro boards into arrays and prunes all of them at once.
+    Every board is flattened into a list of cells: domains are stored as bitmasks
+    (bit d set means digit d is possible), each row and column is a run with a
+    membership mask over the cells and a clue. Sum and all-different pruning is
+    applied to the whole batch until nothing changes; boards that are not settled
+    by propagation alone are handed to the backtracking solver """
+
+    SOLVED = "solved"
+    UNSOLVABLE = "unsolvable"
+    OPEN = "open"
+
+    def __init__(self, kakuro_boards):
+        if np is None:
+            raise ImportError("KakuroBatchPropagator requires numpy")
+        self.boards = list(kakuro_boards)
+        num_boards = len(self.boards)
+        num_cells = max([sum(len(row) for row in board.board) for board in self.boards], default=0)
+        num_runs = max([2 * board.get_size() for board in self.boards], default=0)
+
+        self.domains = np.zeros((num_boards, num_cells), dtype=np.uint16)
+        self.valid = np.zeros((num_boards, num_cells), dtype=bool)
+        self.membership = np.zeros((num_boards, num_runs, num_cells), dtype=bool)
+        self.clues = np.zeros((num_boards, num_runs), dtype=np.int64)
+        self.statuses = [self.OPEN] * num_boards
+
+        for b, board in enumerate(self.boards):
+            size = board.get_size()
+            self.clues[b, :size] = board.get_row_constraints()
+            self.clues[b, size:2 * size] = board.get_col_constraints()
+            c = 0
+            for row_index, row in enumerate(board.board):
+                for cell in row:
+                    # Filled cells are pinned to their value
+                    if isinstance(cell['value'], int):
+                        digits = [cell['value']]
+                    else:
+                        digits = cell['domain']
+                    self.domains[b, c] = sum(1 << d for d in digits)
+                    self.valid[b, c] = True
+                    self.membership[b, row_index, c] = True
+                    self.membership[b, size + cell['index'], c] = True
+                    c += 1
+
+    def _planes(self, domains):
+        """ Unpack bitmask domains into a boolean array with one plane per digit """
+        return ((domains[..., None] >> DIGITS) & 1).astype(bool)
+
+    def _pack(self, planes):
+        """ Pack boolean digit planes back into bitmask domains """
+        return (planes * BITS).sum(axis=-1).astype(np.uint16)
+
+    def _sum_mask(self, planes):
+        """ Bitmask of values each cell can take given the min/max of the other cells in its runs """
+        nonempty = planes.any(axis=-1) & self.valid
+        mins = np.where(nonempty, planes.argmax(axis=-1) + 1, 0)
+        maxs = np.where(nonempty, 9 - planes[..., ::-1].argmax(axis=-1), 0)
+
+        run_min = (self.membership * mins[:, None, :]).sum(axis=-1)
+        run_max = (self.membership * maxs[:, None, :]).sum(axis=-1)
+        hi = self.clues[:, :, None] - (run_min[:, :, None] - mins[:, None, :])
+        lo = self.clues[:, :, None] - (run_max[:, :, None] - maxs[:, None, :])
+        hi = np.where(self.membership, hi, 9).min(axis=1)
+        lo = np.where(self.membership, lo, 1).max(axis=1)
+
+        return self._pack((DIGITS >= lo[..., None]) & (DIGITS <= hi[..., None]))
+
+    def _alldiff_mask(self, planes):
+        """ Bitmask of values fixed by another cell in the same run, and per-board conflicts """
+        singles = planes.sum(axis=-1) == 1
+        fixed = (planes & singles[..., None]).astype(np.int64)
+        run_counts = np.einsum('nrc,ncd->nrd', self.membership.astype(np.int64), fixed)
+        conflict = (run_counts > 1).any(axis=(1, 2))
+
+        # Every cell sits in exactly one row and one column run, so summing the counts
+        # of its two runs counts its own fixed value twice; subtract that
+        total = np.einsum('nrc,nrd->ncd', self.membership.astype(np.int64), run_counts)
+        taken = (total - 2 * fixed) > 0
+        return self._pack(taken), conflict
+
+    def propagate(self):
+        """ Apply sum and all-different pruning to every board until a fixpoint,
+        then classify each board as solved, unsolvable or open """
+        if not self.boards:
+            return self.statuses
+        conflict = np.zeros(len(self.boards), dtype=bool)
+        while True:
+            planes = self._planes(self.domains)
+            taken, conflict = self._alldiff_mask(planes)
+            pruned = self.domains & self._sum_mask(planes) & ~taken & np.where(self.valid, 0x3FE, 0)
+            pruned = pruned.astype(np.uint16)
+            if np.array_equal(pruned, self.domains):
+                break
+            self.domains = pruned
+
+        planes = self._planes(self.domains)
+        counts = planes.sum(axis=-1)
+        values = np.where(counts == 1, planes.argmax(axis=-1) + 1, 0)
+        run_sums = (self.membership * values[:, None, :]).sum(axis=-1)
+
+        empty = (self.valid & (counts == 0)).any(axis=1)
+        settled = np.where(self.valid, counts == 1, True).all(axis=1)
+        sums_met = (run_sums == np.where(self.membership.any(axis=-1), self.clues, 0)).all(axis=1)
+
+        for b in range(len(self.boards)):
+            if empty[b] or conflict[b] or (settled[b] and not sums_met[b]):
+                self.statuses[b] = self.UNSOLVABLE
+            elif settled[b]:
+                self.statuses[b] = self.SOLVED
+            else:
+                self.statuses[b] = self.OPEN
+        return self.statuses
+
+    def write_back(self):
+        """ Copy pruned domains and forced values back into the unfilled cells of the boards.
+        As in ac3, a filled cell's domain excludes its own value """
+        planes = self._planes(self.domains)
+        for b, board in enumerate(self.boards):
+            if self.statuses[b] == self.UNSOLVABLE:
+                continue
+            c = 0
+            for row in board.board:
+                for cell in row:
+                    if cell['value'] is None:
+                        domain = [int(d) for d in DIGITS[planes[b, c]]]
+                        if len(domain) == 1:
+                            cell['value'] = domain[0]
+                            domain = [integer for integer in domain if integer != cell['value']]
+                        cell['domain'] = domain
+                    c += 1
+
+    def solve(self):
+        """ Propagate the whole batch, then backtrack on the boards propagation could not settle.
+        Returns a list of solvers (None for boards settled by propagation) and whether each board was solved """
+        if not self.boards:
+            return [], []
+        self.propagate()
+        self.write_back()
+
+        solvers = [None] * len(self.boards)
+        solved = [status == self.SOLVED for status in self.statuses]
+        for b, board in enumerate(self.boards):
+            if self.statuses[b] == self.OPEN:
+                solvers[b] = KakuroBoardSolver()
+                solved[b] = solvers[b].backtrack(board)
+        return solvers, solved
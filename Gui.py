@@ -212,7 +212,7 @@ def main():
                         Solved = True
                     # Manually step through the solution
                     if solution_step < len(solver.timeline):
-                        kakuro.set_board(solver.timeline[solution_step].board)
+                        kakuro.set_board(solver.timeline[solution_step])
                         solution_step += 1
                         redraw_game_window(solution_step)
                 elif play_pause_button.is_over(pos):
@@ -234,7 +234,7 @@ def main():
         # Automatic playback logic
         if is_playing and current_time - last_playback_time > playback_speed:
             if solution_step < len(solver.timeline):
-                kakuro.set_board(solver.timeline[solution_step].board)
+                kakuro.set_board(solver.timeline[solution_step])
                 solution_step += 1
                 redraw_game_window(solution_step)
                 last_playback_time = current_time
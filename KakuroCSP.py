@@ -1,6 +1,12 @@
 import random
 import math
 import copy
+from array import array
+
+# Snapshot encoding: each cell is stored as two unsigned shorts, its value
+# (EMPTY_VALUE when unassigned) and its domain as a bitmask of digits 0-9
+EMPTY_VALUE = 0xFFFF
+DOMAIN_OF_MASK = [tuple(d for d in range(10) if mask >> d & 1) for mask in range(1 << 10)]
 
 class KakuroConfig:  
     """Utility class for the configuration of the Kakaro Board"""
@@ -60,12 +66,44 @@ class KakuroBoard:
 
     def set_board(self, new_board_state):
         """Set the board to a new state provided by the solver's timeline."""
-        # Replace the entire board with the new state
-        self.board = new_board_state
+        if isinstance(new_board_state, bytes):
+            # Snapshots only hold values and domains, restore them in place
+            self.restore(new_board_state)
+        else:
+            # Replace the entire board with the new state
+            self.board = new_board_state
+
+    def snapshot(self):
+        """ Capture the values and domains of every cell into an immutable bytes buffer.
+        The board layout and constraints are not included, restore() reuses them """
+        state = array('H')
+        for row in self.board:
+            for cell in row:
+                state.append(EMPTY_VALUE if cell['value'] is None else cell['value'])
+                state.append(sum(1 << d for d in cell['domain']))
+        return state.tobytes()
+
+    def restore(self, snapshot):
+        """ Restore the values and domains captured by snapshot() """
+        state = array('H')
+        state.frombytes(snapshot)
+        num_cells = sum(len(row) for row in self.board)
+        if len(state) != 2 * num_cells:
+            raise ValueError("Snapshot holds %d cells but the board has %d" % (len(state) // 2, num_cells))
+        i = 0
+        for row in self.board:
+            for cell in row:
+                value = state[i]
+                cell['value'] = None if value == EMPTY_VALUE else value
+                cell['domain'] = list(DOMAIN_OF_MASK[state[i + 1]])
+                i += 2
 
     def deep_copy(self):
-        """Create a deep copy of the board."""
-        return copy.deepcopy(self)
+        """Create a copy of the board with its own cells, sharing the constraints."""
+        board_copy = copy.copy(self)
+        board_copy.board = [[{'index': cell['index'], 'value': cell['value'], 'domain': list(cell['domain'])}
+                             for cell in row] for row in self.board]
+        return board_copy
 
     def get_size(self):
         """ Get the size of the puzzle """